@@ -5,15 +5,17 @@ Transparently load variables from environment or JSON/YAML file.
 # Note: the following line is included to ensure Python3.9 compatibility.
 from __future__ import annotations
 
+import copy
 import errno
+import hashlib
 import json
 import logging
 import os
 import sys
-from functools import partial
+from functools import lru_cache, partial
 from io import StringIO
 from types import GenericAlias
-from typing import TYPE_CHECKING, cast, get_args
+from typing import TYPE_CHECKING, ClassVar, cast, get_args
 
 from pydantic._internal._config import config_keys
 from pydantic.fields import Field, PydanticUndefined
@@ -25,6 +27,7 @@ from pydantic_settings import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Any
 
     from pydantic.fields import FieldInfo
@@ -40,6 +43,8 @@ class GoodConfConfigDict(SettingsConfigDict):
     file_env_var: str | None
     # if no file is given, try to load a configuration from these files in order
     default_files: list[str] | None
+    # directory to cache parsed YAML/TOML files as JSON for faster startup
+    parse_cache_dir: str | None
 
 
 # Note: code from pydantic-settings/pydantic_settings/main.py:
@@ -52,51 +57,226 @@ class GoodConfConfigDict(SettingsConfigDict):
 config_keys |= set(GoodConfConfigDict.__annotations__.keys())
 
 
-def _load_config(path: str) -> dict[str, Any]:
+@lru_cache(maxsize=None)
+def _get_yaml_loader() -> Callable[[Any], Any]:
+    """
+    Return a callable that parses a YAML stream, importing the parser lazily
+    and only once.
+    """
+    import ruamel.yaml
+
+    # pure=False uses ruamel.yaml.clib's C parser when installed and falls
+    # back to the pure-Python one otherwise, keeping YAML 1.2 semantics
+    # either way.
+    return ruamel.yaml.YAML(typ="safe", pure=False).load
+
+
+@lru_cache(maxsize=None)
+def _get_yaml_rt() -> Any:
+    """
+    Return a single round-trip ``ruamel.yaml.YAML`` instance for generation,
+    with the ``None``-as-``~`` representer already registered.
+    """
+    import ruamel.yaml
+
+    yaml = ruamel.yaml.YAML()
+    yaml.representer.add_representer(
+        type(None),
+        lambda self, d: self.represent_scalar("tag:yaml.org,2002:null", "~"),
+    )
+    return yaml
+
+
+@lru_cache(maxsize=None)
+def _get_tomlkit() -> Any:
+    import tomlkit
+
+    return tomlkit
+
+
+@lru_cache(maxsize=None)
+def _get_json_loads() -> Callable[[bytes], Any]:
+    """
+    Return a JSON parse callable, preferring orjson when installed.
+    """
+    try:
+        from orjson import loads
+    except ImportError:
+        loads = json.loads
+    return loads
+
+
+@lru_cache(maxsize=None)
+def _get_json_dumps() -> Callable[[Any], str]:
+    """
+    Return a JSON dump callable producing 2-space-indented output,
+    preferring orjson when installed.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return partial(json.dumps, indent=2)
+    return lambda data: orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+def _load_config(path: str, parse_cache_dir: str | None = None) -> dict[str, Any]:
     """
     Given a file path, parse it based on its extension (YAML, TOML or JSON)
     and return the values as a Python dictionary. JSON is the default if an
     extension can't be determined.
+
+    Parsed files are cached by path, modification time and size, so repeated
+    instantiations of the same ``GoodConf`` subclass don't re-parse an
+    unchanged file. If ``parse_cache_dir`` is given, parsed YAML/TOML files
+    are additionally cached there as JSON so later processes can skip the
+    slower parse entirely.
     """
-    __, ext = os.path.splitext(path)
-    if ext in [".yaml", ".yml"]:
-        import ruamel.yaml
+    path = os.fspath(path)
+    stat = os.stat(path)
+    abspath = os.path.abspath(path)
+    if parse_cache_dir and not path.endswith(".json"):
+        cached = _read_parse_cache(abspath, stat.st_mtime_ns, parse_cache_dir)
+        if cached is not None:
+            return cached
+        config = copy.deepcopy(
+            _load_config_cached(abspath, stat.st_mtime_ns, stat.st_size)
+        )
+        _write_parse_cache(abspath, stat.st_mtime_ns, parse_cache_dir, config)
+        return config
+    return copy.deepcopy(_load_config_cached(abspath, stat.st_mtime_ns, stat.st_size))
 
-        yaml = ruamel.yaml.YAML(typ="safe", pure=True)
-        loader = yaml.load
-    elif ext == ".toml":
-        try:
-            import tomllib
 
-            def load(stream):
-                return tomllib.loads(f.read())
-        except ImportError:  # Fallback for Python < 3.11
-            import tomlkit
+def _parse_cache_path(path: str, parse_cache_dir: str) -> str:
+    digest = hashlib.sha256(path.encode()).hexdigest()
+    return os.path.join(parse_cache_dir, f"{digest}.json")
 
-            def load(stream):
-                return tomlkit.load(f).unwrap()
 
-        loader = load
+def _read_parse_cache(
+    path: str, mtime_ns: int, parse_cache_dir: str
+) -> dict[str, Any] | None:
+    cache_path = _parse_cache_path(path, parse_cache_dir)
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # A foreign or mangled cache file may hold any valid JSON; only trust the
+    # expected shape.
+    if not isinstance(cached, dict) or cached.get("__src_mtime_ns") != mtime_ns:
+        return None
+    config = cached.get("config")
+    return config if isinstance(config, dict) else None
 
-    else:
-        loader = json.load
-    with open(path) as f:
-        config = loader(f)
-    return config or {}
+
+def _write_parse_cache(
+    path: str, mtime_ns: int, parse_cache_dir: str, config: dict[str, Any]
+) -> None:
+    cache_path = _parse_cache_path(path, parse_cache_dir)
+    try:
+        serialized = json.dumps({"__src_mtime_ns": mtime_ns, "config": config})
+    except (TypeError, ValueError):
+        # Config contains values JSON can't represent (datetimes, ...)
+        return
+    try:
+        os.makedirs(parse_cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(serialized)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        log.debug("Unable to write parse cache %s", cache_path)
+
+
+@lru_cache(maxsize=128)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    # buffering=0 skips the BufferedReader wrapper; readall() still pulls the
+    # whole file in as few reads as possible.
+    with open(path, "rb", buffering=0) as f:
+        raw = f.read()
+    # Cheaper than os.path.splitext; a path without a suffix falls through to
+    # the JSON default just as it did with splitext.
+    ext = path.rpartition(".")[2].lower()
+    return _parse_config(ext, raw)
+
+
+@lru_cache(maxsize=128)
+def _parse_config(ext: str, raw: bytes) -> dict[str, Any]:
+    """
+    Parse raw config file content based on the file's extension. Cached on
+    the content itself, so a `touch` or a rewrite with identical bytes only
+    costs a re-read, not a re-parse.
+    """
+    return _get_parser(ext)(raw) or {}
+
+
+def _parse_yaml_or_json(raw: bytes) -> Any:
+    """
+    JSON is a subset of YAML, so YAML files holding JSON content (starting
+    with '{' or '[') can be parsed by the much faster JSON parser. The YAML
+    parser is only imported when the content actually needs it.
+    """
+    if raw.lstrip()[:1] in (b"{", b"["):
+        try:
+            return _get_json_loads()(raw)
+        except ValueError:
+            # Flow-style YAML that isn't valid JSON; use the YAML parser.
+            pass
+    return _get_yaml_loader()(raw.decode())
+
+
+@lru_cache(maxsize=None)
+def _get_parser(ext: str) -> Callable[[bytes], Any]:
+    """
+    Return a callable parsing raw config bytes for the given extension
+    (without the leading dot). JSON is the default for unknown extensions.
+    """
+    if ext in ("yaml", "yml"):
+        return _parse_yaml_or_json
+    if ext == "toml":
+        try:
+            import tomllib
+
+            return lambda raw: tomllib.loads(raw.decode())
+        except ImportError:  # Fallback for Python < 3.11
+            tomlkit = _get_tomlkit()
+            return lambda raw: tomlkit.loads(raw.decode()).unwrap()
+    return _get_json_loads()
 
 
 def _find_file(filename: str, require: bool = True) -> str | None:
-    if not os.path.exists(filename):
+    try:
+        os.stat(filename)
+    except OSError:
         if not require:
             return None
-        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), filename)
+        raise FileNotFoundError(
+            errno.ENOENT, os.strerror(errno.ENOENT), filename
+        ) from None
     return os.path.abspath(filename)
 
 
+# Annotation objects are class-level singletons, so their string form can be
+# memoized by identity. The annotation itself is kept in the value to hold a
+# reference, ensuring the id() key stays valid for the life of the cache.
+_annotation_str_cache: dict[int, tuple[Any, str]] = {}
+
+
 def _fieldinfo_to_str(field_info: FieldInfo) -> str:
     """
     Return the string representation of a pydantic.fields.FieldInfo.
     """
+    cached = _annotation_str_cache.get(id(field_info.annotation))
+    if cached is not None:
+        return cached[1]
+    field_type = _annotation_to_str(field_info)
+    _annotation_str_cache[id(field_info.annotation)] = (
+        field_info.annotation,
+        field_type,
+    )
+    return field_type
+
+
+def _annotation_to_str(field_info: FieldInfo) -> str:
     if isinstance(field_info.annotation, type) and not isinstance(
         field_info.annotation, GenericAlias
     ):
@@ -115,24 +295,49 @@ def _fieldinfo_to_str(field_info: FieldInfo) -> str:
 
 
 def initial_for_field(name: str, field_info: FieldInfo) -> Any:
-    try:
-        json_schema_extra = field_info.json_schema_extra or {}
-        if not callable(json_schema_extra["initial"]):
+    json_schema_extra = field_info.json_schema_extra or {}
+    if "initial" in json_schema_extra:
+        initial = json_schema_extra["initial"]
+        if not callable(initial):
             raise ValueError(f"Initial value for `{name}` must be a callable.")
-        return field_info.json_schema_extra["initial"]()
-    except KeyError:
-        if (
-            field_info.default is not PydanticUndefined
-            and field_info.default is not ...
-        ):
-            return field_info.default
-        if field_info.default_factory is not None:
-            return field_info.default_factory()
+        return initial()
+    if field_info.default is not PydanticUndefined and field_info.default is not ...:
+        return field_info.default
+    if field_info.default_factory is not None:
+        return field_info.default_factory()
     if type(None) in get_args(field_info.annotation):
         return None
     return ""
 
 
+def _all_fields_in_env(settings_cls: type[BaseSettings]) -> bool:
+    """
+    Return True when every declared field has a matching environment variable.
+
+    Environment variables take precedence over file values, so in that case a
+    config file's values would all be shadowed and parsing it can be skipped.
+    """
+    fields = settings_cls.model_fields
+    if not fields:
+        return False
+    if settings_cls.model_config.get("extra") == "allow":
+        # A file may contribute keys beyond the declared fields.
+        return False
+    prefix = settings_cls.model_config.get("env_prefix") or ""
+    case_sensitive = settings_cls.model_config.get("case_sensitive")
+    for name, field_info in fields.items():
+        if field_info.validation_alias is not None:
+            # Aliased fields use bespoke env names; don't try to guess them.
+            return False
+        env_name = f"{prefix}{name}"
+        if env_name in os.environ:
+            continue
+        # The env source only matches other casings when case_sensitive is off.
+        if case_sensitive or env_name.upper() not in os.environ:
+            return False
+    return True
+
+
 class FileConfigSettingsSource(PydanticBaseSettingsSource):
     """
     Source class for loading values provided during settings class initialization.
@@ -149,9 +354,22 @@ class FileConfigSettingsSource(PydanticBaseSettingsSource):
 
     def __call__(self) -> dict[str, Any]:
         settings = cast(GoodConf, self.settings_cls)
+        model_config = settings.model_config
+        if (
+            not self.current_state.get("_config_file")
+            and not model_config.get("file_env_var")
+            and not model_config.get("default_files")
+        ):
+            # No file lookup configured at all; don't bother checking the
+            # environment or the filesystem.
+            log.info("No config file specified. Loading with environment variables.")
+            return {}
         selected_config_file = None
         if cfg_file := self.current_state.get("_config_file"):
             selected_config_file = cfg_file
+        elif _all_fields_in_env(self.settings_cls):
+            log.debug("All fields set by environment variables. Skipping file load.")
+            return {}
         elif (file_env_var := settings.model_config.get("file_env_var")) and (
             cfg_file := os.environ.get(file_env_var)
         ):
@@ -162,7 +380,15 @@ class FileConfigSettingsSource(PydanticBaseSettingsSource):
                 if selected_config_file:
                     break
         if selected_config_file:
-            values = _load_config(selected_config_file)
+            parse_cache_dir = settings.model_config.get(
+                "parse_cache_dir"
+            ) or os.environ.get("GOODCONF_CACHE_DIR")
+            if parse_cache_dir:
+                values = _load_config(
+                    selected_config_file, parse_cache_dir=parse_cache_dir
+                )
+            else:
+                values = _load_config(selected_config_file)
             log.info("Loading config from %s", selected_config_file)
         else:
             values = {}
@@ -174,6 +400,36 @@ class FileConfigSettingsSource(PydanticBaseSettingsSource):
 
 
 class GoodConf(BaseSettings):
+    # Derived from `model_fields` once per class (see `__pydantic_init_subclass__`)
+    # so `get_initial` and the `generate_*` methods don't re-derive metadata on
+    # every call. Each plan entry is `(name, static, value)`: a static value to
+    # use as-is, or the field's FieldInfo to resolve via `initial_for_field`.
+    _initial_plan: ClassVar[tuple] = ()
+    # `(name, field_info, type_str)` per field, for `generate_markdown`.
+    _field_meta: ClassVar[tuple] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        plan = []
+        for name, field_info in cls.model_fields.items():
+            json_schema_extra = field_info.json_schema_extra or {}
+            if (
+                isinstance(json_schema_extra, dict)
+                and "initial" not in json_schema_extra
+                and field_info.default_factory is None
+                and field_info.default is not PydanticUndefined
+                and field_info.default is not ...
+            ):
+                plan.append((name, True, field_info.default))
+            else:
+                plan.append((name, False, field_info))
+        cls._initial_plan = tuple(plan)
+        cls._field_meta = tuple(
+            (name, field_info, _fieldinfo_to_str(field_info))
+            for name, field_info in cls.model_fields.items()
+        )
+
     def __init__(
         self, load: bool = False, config_file: str | None = None, **kwargs
     ) -> None:
@@ -238,8 +494,10 @@ class GoodConf(BaseSettings):
     @classmethod
     def get_initial(cls, **override) -> dict:
         return {
-            k: override.get(k, initial_for_field(k, v))
-            for k, v in cls.model_fields.items()
+            name: override.get(
+                name, value if static else initial_for_field(name, value)
+            )
+            for name, static, value in cls._initial_plan
         }
 
     @classmethod
@@ -247,27 +505,20 @@ class GoodConf(BaseSettings):
         """
         Dumps initial config in YAML
         """
-        import ruamel.yaml
+        from ruamel.yaml.comments import CommentedMap
 
-        yaml = ruamel.yaml.YAML()
-        yaml.representer.add_representer(
-            type(None),
-            lambda self, d: self.represent_scalar("tag:yaml.org,2002:null", "~"),
-        )
-        yaml_str = StringIO()
-        yaml.dump(cls.get_initial(**override), stream=yaml_str)
-        yaml_str.seek(0)
-        dict_from_yaml = yaml.load(yaml_str)
+        yaml = _get_yaml_rt()
+        commented_map = CommentedMap(cls.get_initial(**override))
         if cls.__doc__:
-            dict_from_yaml.yaml_set_start_comment("\n" + cls.__doc__ + "\n\n")
-        for k in dict_from_yaml.keys():
-            if cls.model_fields[k].description:
-                description = cast(str, cls.model_fields[k].description)
-                dict_from_yaml.yaml_set_comment_before_after_key(
+            commented_map.yaml_set_start_comment("\n" + cls.__doc__ + "\n\n")
+        for k, field_info, __ in cls._field_meta:
+            if field_info.description:
+                description = cast(str, field_info.description)
+                commented_map.yaml_set_comment_before_after_key(
                     k, before="\n" + description
                 )
         yaml_str = StringIO()
-        yaml.dump(dict_from_yaml, yaml_str)
+        yaml.dump(commented_map, yaml_str)
         yaml_str.seek(0)
         return yaml_str.read()
 
@@ -276,25 +527,24 @@ class GoodConf(BaseSettings):
         """
         Dumps initial config in JSON
         """
-        return json.dumps(cls.get_initial(**override), indent=2)
+        return _get_json_dumps()(cls.get_initial(**override))
 
     @classmethod
     def generate_toml(cls, **override) -> str:
         """
         Dumps initial config in TOML
         """
-        import tomlkit
         from tomlkit.items import Item
 
-        toml_str = tomlkit.dumps(cls.get_initial(**override))
-        dict_from_toml = tomlkit.loads(toml_str)
+        tomlkit = _get_tomlkit()
+        initial = cls.get_initial(**override)
         document = tomlkit.document()
         if cls.__doc__:
             document.add(tomlkit.comment(cls.__doc__))
-        for k, v in dict_from_toml.unwrap().items():
-            document.add(k, v)
-            if cls.model_fields[k].description:
-                description = cast(str, cls.model_fields[k].description)
+        for k, field_info, __ in cls._field_meta:
+            document.add(k, initial[k])
+            if field_info.description:
+                description = cast(str, field_info.description)
                 cast(Item, document[k]).comment(description)
         return tomlkit.dumps(document)
 
@@ -303,24 +553,26 @@ class GoodConf(BaseSettings):
         """
         Documents values in markdown
         """
-        lines = []
-        if cls.__doc__:
-            lines.extend([f"# {cls.__doc__}", ""])
-
-        for k, field_info in cls.model_fields.items():
-            lines.append(f"* **{k}**")
-            if field_info.is_required():
-                lines[-1] = f"{lines[-1]} _REQUIRED_"
-            if field_info.description:
-                lines.append(f"  * description: {field_info.description}")
-            # We want to append a line with the field_info type, and sometimes
-            # field_info.annotation looks the way we want, like 'list[str]', but
-            # other times, it includes some extra text, like '<class 'bool'>'.
-            # Therefore, we have some logic to make the type show up the way we want.
-            field_type = _fieldinfo_to_str(field_info)
-            lines.append(f"  * type: `{field_type}`")
-            if field_info.default not in [None, PydanticUndefined]:
-                lines.append(f"  * default: `{field_info.default}`")
+        lines = [f"# {cls.__doc__}", ""] if cls.__doc__ else []
+        # The type string is precomputed because sometimes
+        # field_info.annotation looks the way we want, like 'list[str]', but
+        # other times, it includes some extra text, like '<class 'bool'>'
+        # (see _fieldinfo_to_str).
+        for k, field_info, field_type in cls._field_meta:
+            required = " _REQUIRED_" if field_info.is_required() else ""
+            description = (
+                f"\n  * description: {field_info.description}"
+                if field_info.description
+                else ""
+            )
+            default = (
+                f"\n  * default: `{field_info.default}`"
+                if field_info.default not in [None, PydanticUndefined]
+                else ""
+            )
+            lines.append(
+                f"* **{k}**{required}{description}\n  * type: `{field_type}`{default}"
+            )
         return "\n".join(lines)
 
     def django_manage(self, args: list[str] | None = None):
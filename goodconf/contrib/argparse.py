@@ -2,17 +2,29 @@ import argparse
 
 from .. import GoodConf
 
+# The help text is rebuilt on every parser construction (once per Django
+# management subcommand) but only depends on the config class, so cache it.
+_help_cache: dict[type, str] = {}
+
+
+def _config_help(config: GoodConf) -> str:
+    cls = type(config)
+    help = _help_cache.get(cls)
+    if help is None:
+        parts = ["Config file."]
+        cfg = config.model_config
+        if cfg.get("file_env_var"):
+            parts.append(
+                "Can also be configured via the environment variable: "
+                f"{cfg['file_env_var']}"
+            )
+        if cfg.get("default_files"):
+            files_str = ", ".join(cfg["default_files"])
+            parts.append(f" Defaults to the first file that exists from [{files_str}].")
+        help = _help_cache[cls] = "".join(parts)
+    return help
+
 
 def argparser_add_argument(parser: argparse.ArgumentParser, config: GoodConf):
     """Adds argument for config to existing argparser"""
-    help = "Config file."
-    cfg = config.model_config
-    if cfg.get("file_env_var"):
-        help += (
-            "Can also be configured via the environment variable: "
-            f"{cfg['file_env_var']}"
-        )
-    if cfg.get("default_files"):
-        files_str = ", ".join(cfg["default_files"])
-        help += f" Defaults to the first file that exists from [{files_str}]."
-    parser.add_argument("-C", "--config", metavar="FILE", help=help)
+    parser.add_argument("-C", "--config", metavar="FILE", help=_config_help(config))
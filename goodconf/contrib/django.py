@@ -17,13 +17,20 @@ def load_config_from_cli(
     from django.core.management.base import BaseCommand
 
     original_parser = BaseCommand.create_parser
+    # Rebinding a class attribute invalidates CPython's type attribute cache
+    # for BaseCommand and all its subclasses, so don't stack patches when
+    # calls nest.
+    already_patched = getattr(original_parser, "_goodconf_patched", False)
 
-    def patched_parser(self, prog_name, subcommand):
-        parser = original_parser(self, prog_name, subcommand)
-        argparser_add_argument(parser, config)
-        return parser
+    if not already_patched:
+
+        def patched_parser(self, prog_name, subcommand):
+            parser = original_parser(self, prog_name, subcommand)
+            argparser_add_argument(parser, config)
+            return parser
 
-    BaseCommand.create_parser = patched_parser
+        patched_parser._goodconf_patched = True
+        BaseCommand.create_parser = patched_parser
 
     try:
         parser = argparse.ArgumentParser(add_help=False)
@@ -33,8 +40,9 @@ def load_config_from_cli(
         config.load(config_arg.config)
         yield default_args
     finally:
-        # Put that create_parser back where it came from or so help me!
-        BaseCommand.create_parser = original_parser
+        if not already_patched:
+            # Put that create_parser back where it came from or so help me!
+            BaseCommand.create_parser = original_parser
 
 
 def execute_from_command_line_with_config(config: GoodConf, argv: list[str]):
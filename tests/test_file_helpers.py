@@ -1,8 +1,18 @@
+import json
 import os
 import sys
+
 import pytest
 
-from goodconf import _find_file, _load_config
+from goodconf import _find_file, _load_config, _load_config_cached
+
+from .utils import HAS_TOMLKIT, requires_yaml
+
+# Python < 3.11 has no stdlib tomllib; tomlkit is the fallback parser.
+needs_toml_parser = pytest.mark.skipif(
+    sys.version_info < (3, 11) and not HAS_TOMLKIT,
+    reason="no TOML parser available",
+)
 
 
 def test_json(tmpdir):
@@ -11,36 +21,73 @@ def test_json(tmpdir):
     assert _load_config(str(conf)) == {"a": "b", "c": 3}
 
 
+@needs_toml_parser
 def test_load_toml(tmpdir):
-    if sys.version_info < (3, 11):
-        pytest.importorskip("tomlkit")
     conf = tmpdir.join("conf.toml")
     conf.write('a = "b"\nc = 3')
     assert _load_config(str(conf)) == {"a": "b", "c": 3}
 
 
+@needs_toml_parser
 def test_load_empty_toml(tmpdir):
-    if sys.version_info < (3, 11):
-        pytest.importorskip("tomlkit")
     conf = tmpdir.join("conf.toml")
     conf.write("")
     assert _load_config(str(conf)) == {}
 
 
+@requires_yaml
 def test_yaml(tmpdir):
-    pytest.importorskip("ruamel.yaml")
     conf = tmpdir.join("conf.yaml")
     conf.write("a: b\nc: 3")
     assert _load_config(str(conf)) == {"a": "b", "c": 3}
 
 
+def test_yaml_with_json_content(tmpdir):
+    conf = tmpdir.join("conf.yaml")
+    conf.write('{"a": "b", "c": 3}')
+    assert _load_config(str(conf)) == {"a": "b", "c": 3}
+
+
+@requires_yaml
 def test_load_empty_yaml(tmpdir):
-    pytest.importorskip("ruamel.yaml")
     conf = tmpdir.join("conf.yaml")
     conf.write("")
     assert _load_config(str(conf)) == {}
 
 
+@requires_yaml
+def test_parse_cache_dir(tmpdir):
+    conf = tmpdir.join("conf.yaml")
+    conf.write("a: b")
+    cache_dir = tmpdir.join("cache")
+    assert _load_config(str(conf), parse_cache_dir=str(cache_dir)) == {"a": "b"}
+    cache_files = os.listdir(str(cache_dir))
+    assert len(cache_files) == 1
+    # Prove the sidecar is actually read: edit its payload, drop the
+    # in-process cache and check the edited value comes back.
+    sidecar = cache_dir.join(cache_files[0])
+    cached = json.loads(sidecar.read())
+    cached["config"]["a"] = "from-sidecar"
+    sidecar.write(json.dumps(cached))
+    _load_config_cached.cache_clear()
+    assert _load_config(str(conf), parse_cache_dir=str(cache_dir)) == {
+        "a": "from-sidecar"
+    }
+
+
+@requires_yaml
+def test_parse_cache_dir_bad_sidecar(tmpdir):
+    conf = tmpdir.join("conf.yaml")
+    conf.write("a: b")
+    cache_dir = tmpdir.join("cache")
+    _load_config(str(conf), parse_cache_dir=str(cache_dir))
+    # Non-object JSON in the sidecar is treated as a miss, not an error.
+    sidecar = cache_dir.join(os.listdir(str(cache_dir))[0])
+    sidecar.write("[]")
+    _load_config_cached.cache_clear()
+    assert _load_config(str(conf), parse_cache_dir=str(cache_dir)) == {"a": "b"}
+
+
 def test_missing(tmpdir):
     conf = tmpdir.join("test.yml")
     assert _find_file(str(conf), require=False) is None
@@ -2,10 +2,8 @@ import json
 
 from goodconf import GoodConf
 
-from .utils import env_var
 
-
-def test_conf_env_var(mocker, tmpdir):
+def test_conf_env_var(mocker, tmpdir, monkeypatch):
     mocked_load_config = mocker.patch("goodconf._load_config")
     path = tmpdir.join("myapp.json")
     path.write("")
@@ -13,13 +11,13 @@ def test_conf_env_var(mocker, tmpdir):
     class G(GoodConf):
         model_config = {"file_env_var": "CONF"}
 
-    with env_var("CONF", str(path)):
-        g = G()
-        g.load()
+    monkeypatch.setenv("CONF", str(path))
+    g = G()
+    g.load()
     mocked_load_config.assert_called_once_with(str(path))
 
 
-def test_conflict(tmpdir):
+def test_conflict(tmpdir, monkeypatch):
     path = tmpdir.join("myapp.json")
     path.write(json.dumps({"A": 1, "B": 2}))
 
@@ -29,13 +27,60 @@ def test_conflict(tmpdir):
 
         model_config = {"default_files": [path]}
 
-    with env_var("A", "3"):
-        g = G()
-        g.load()
+    monkeypatch.setenv("A", "3")
+    g = G()
+    g.load()
     assert g.A == 3
     assert g.B == 2
 
 
+def test_env_covers_all_fields(mocker, tmpdir, monkeypatch):
+    mocked_load_config = mocker.patch("goodconf._load_config")
+    path = tmpdir.join("myapp.json")
+    path.write(json.dumps({"A": 1}))
+
+    class G(GoodConf):
+        A: int
+
+        model_config = {"default_files": [str(path)]}
+
+    monkeypatch.setenv("A", "3")
+    g = G(load=True)
+    assert g.A == 3
+    mocked_load_config.assert_not_called()
+
+
+def test_env_extra_allow_still_loads_file(tmpdir, monkeypatch):
+    path = tmpdir.join("myapp.json")
+    path.write(json.dumps({"a": 1, "b": 2}))
+
+    class G(GoodConf):
+        a: int
+
+        model_config = {"default_files": [str(path)], "extra": "allow"}
+
+    # The file contributes undeclared "b" even with "a" covered by the env.
+    monkeypatch.setenv("A", "3")
+    g = G(load=True)
+    assert g.a == 3
+    assert g.b == 2
+
+
+def test_env_case_sensitive_still_loads_file(tmpdir, monkeypatch):
+    path = tmpdir.join("myapp.json")
+    path.write(json.dumps({"a": 1}))
+
+    class G(GoodConf):
+        a: int
+
+        model_config = {"default_files": [str(path)], "case_sensitive": True}
+
+    # "A" doesn't satisfy case-sensitive field "a"; the file must be read.
+    monkeypatch.setenv("A", "3")
+    g = G(load=True)
+    assert g.a == 1
+
+
 def test_all_env_vars(mocker):
     mocked_set_values = mocker.patch("goodconf.BaseSettings.__init__")
     mocked_load_config = mocker.patch("goodconf._load_config")
@@ -1,5 +1,4 @@
 import json
-import os
 import re
 from textwrap import dedent
 from typing import Optional, List, Literal
@@ -9,161 +8,173 @@ from pydantic import Field, ValidationError
 from pydantic.fields import FieldInfo
 
 from goodconf import GoodConf, FileConfigSettingsSource
-from tests.utils import env_var
+from tests.utils import requires_tomlkit, requires_yaml
 
+# ruamel.yaml emits trailing spaces on comment lines; strip them once with a
+# precompiled pattern before comparing output.
+TRAILING_WS = re.compile(r" +\n")
 
-def test_initial():
-    class TestConf(GoodConf):
-        a: bool = Field(initial=lambda: True)
-        b: bool = Field(default=False)
+HELP = "this is a"
+
+# Expected YAML snippets, built once instead of re-dedenting per test.
+COMMENTED_FIELD_YAML = dedent(
+    """\
+    # this is a
+    a: ''
+    """
+)
+NO_DOCSTRING_YAML = dedent(
+    """
+    # this is a
+    a: ''
+    """
+)
+
+
+# Classes are defined at module scope so pydantic only compiles each schema
+# once per test run instead of once per test.
+class InitialConf(GoodConf):
+    a: bool = Field(initial=lambda: True)
+    b: bool = Field(default=False)
+
+
+class DumpJsonConf(GoodConf):
+    a: bool = Field(initial=lambda: True)
+
+
+class TomlDefaultsConf(GoodConf):
+    a: bool = False
+    b: str = "Happy"
+
+
+class DocumentedConf(GoodConf):
+    "Configuration for My App"
+
+    a: str = Field(description=HELP)
+    b: str
+
+
+class NoDocstringConf(GoodConf):
+    a: str = Field(description=HELP)
+
+
+class OptionalConf(GoodConf):
+    a: Optional[str]
+
+
+class MarkdownConf(GoodConf):
+    "Configuration for My App"
+
+    a: int = Field(description=HELP, default=None)
+    b: int = Field(description=HELP, default=5)
+    c: str
+
+
+class MarkdownNoDocstringConf(GoodConf):
+    a: int = Field(description=HELP, default=5)
+    b: str
+
+
+class MarkdownDefaultFalseConf(GoodConf):
+    a: bool = Field(default=False)
+
+
+class MarkdownTypesConf(GoodConf):
+    a: Literal["a", "b"] = Field(default="a")
+    b: list[str] = Field()
+    c: None
+
+
+class RequiredConf(GoodConf):
+    a: str = Field()
+
+
+class EnvPrefixConf(GoodConf):
+    a: bool = False
 
-    initial = TestConf.get_initial()
+    model_config = {"env_prefix": "PREFIX_"}
+
+
+def test_initial():
+    initial = InitialConf.get_initial()
     assert len(initial) == 2
     assert initial["a"] is True
     assert initial["b"] is False
 
 
 def test_dump_json():
-    class TestConf(GoodConf):
-        a: bool = Field(initial=lambda: True)
-
-    assert TestConf.generate_json() == '{\n  "a": true\n}'
-    assert TestConf.generate_json(not_a_value=True) == '{\n  "a": true\n}'
-    assert TestConf.generate_json(a=False) == '{\n  "a": false\n}'
+    assert DumpJsonConf.generate_json() == '{\n  "a": true\n}'
+    assert DumpJsonConf.generate_json(not_a_value=True) == '{\n  "a": true\n}'
+    assert DumpJsonConf.generate_json(a=False) == '{\n  "a": false\n}'
 
 
+@requires_tomlkit
 def test_dump_toml():
-    pytest.importorskip("tomlkit")
-
-    class TestConf(GoodConf):
-        a: bool = False
-        b: str = "Happy"
-
-    output = TestConf.generate_toml()
+    output = TomlDefaultsConf.generate_toml()
     assert "a = false" in output
     assert 'b = "Happy"' in output
 
-    class TestConf(GoodConf):
-        "Configuration for My App"
-
-        a: str = Field(description="this is a")
-        b: str
-
-    output = TestConf.generate_toml()
+    output = DocumentedConf.generate_toml()
 
     assert "# Configuration for My App\n" in output
     assert 'a = "" # this is a' in output
     assert 'b = ""' in output
 
 
+@requires_yaml
 def test_dump_yaml():
-    pytest.importorskip("ruamel.yaml")
-
-    class TestConf(GoodConf):
-        "Configuration for My App"
-
-        a: str = Field(description="this is a")
-        b: str
-
-    output = TestConf.generate_yaml()
-    output = re.sub(r" +\n", "\n", output)
+    output = DocumentedConf.generate_yaml()
+    output = TRAILING_WS.sub("\n", output)
     assert "\n# Configuration for My App\n" in output
-    assert (
-        dedent(
-            """\
-        # this is a
-        a: ''
-        """
-        )
-        in output
-    )
+    assert COMMENTED_FIELD_YAML in output
     assert "b: ''" in output
 
-    output_override = TestConf.generate_yaml(b="yes")
+    output_override = DocumentedConf.generate_yaml(b="yes")
     assert "a: ''" in output_override
     assert "b: yes" in output_override
 
 
+@requires_yaml
 def test_dump_yaml_no_docstring():
-    pytest.importorskip("ruamel.yaml")
-
-    class TestConf(GoodConf):
-        a: str = Field(description="this is a")
-
-    output = TestConf.generate_yaml()
-    output = re.sub(r" +\n", "\n", output)
-    assert output == dedent(
-        """
-        # this is a
-        a: ''
-        """
-    )
+    output = NoDocstringConf.generate_yaml()
+    output = TRAILING_WS.sub("\n", output)
+    assert output == NO_DOCSTRING_YAML
 
 
+@requires_yaml
 def test_dump_yaml_none():
-    pytest.importorskip("ruamel.yaml")
-
-    class TestConf(GoodConf):
-        a: Optional[str]
-
-    output = TestConf.generate_yaml()
+    output = OptionalConf.generate_yaml()
     assert output.strip() == "a: ~"
 
 
 def test_generate_markdown():
-    help_ = "this is a"
-
-    class TestConf(GoodConf):
-        "Configuration for My App"
-
-        a: int = Field(description=help_, default=None)
-        b: int = Field(description=help_, default=5)
-        c: str
-
-    mkdn = TestConf.generate_markdown()
+    mkdn = MarkdownConf.generate_markdown()
     # Not sure on final format, just do some basic smoke tests
-    assert TestConf.__doc__ in mkdn
-    assert help_ in mkdn
+    assert MarkdownConf.__doc__ in mkdn
+    assert HELP in mkdn
 
 
 def test_generate_markdown_no_docstring():
-    help_ = "this is a"
-
-    class TestConf(GoodConf):
-        a: int = Field(description=help_, default=5)
-        b: str
-
-    mkdn = TestConf.generate_markdown()
+    mkdn = MarkdownNoDocstringConf.generate_markdown()
     # Not sure on final format, just do some basic smoke tests
-    assert f"  * description: {help_}" in mkdn.splitlines()
+    assert f"  * description: {HELP}" in mkdn.splitlines()
 
 
 def test_generate_markdown_default_false():
-    class TestConf(GoodConf):
-        a: bool = Field(default=False)
-
-    lines = TestConf.generate_markdown().splitlines()
+    lines = MarkdownDefaultFalseConf.generate_markdown().splitlines()
     assert "  * type: `bool`" in lines
     assert "  * default: `False`" in lines
 
 
 def test_generate_markdown_types():
-    class TestConf(GoodConf):
-        a: Literal["a", "b"] = Field(default="a")
-        b: list[str] = Field()
-        c: None
-
-    lines = TestConf.generate_markdown().splitlines()
+    lines = MarkdownTypesConf.generate_markdown().splitlines()
     assert "  * type: `Literal['a', 'b']`" in lines
     assert "  * type: `list[str]`" in lines
     assert "default: `PydanticUndefined`" not in str(lines)
 
 
 def test_generate_markdown_required():
-    class TestConf(GoodConf):
-        a: str
-
-    lines = TestConf.generate_markdown().splitlines()
+    lines = RequiredConf.generate_markdown().splitlines()
     assert "* **a** _REQUIRED_" in lines
 
 
@@ -174,58 +185,43 @@ def test_undefined():
 
 
 def test_required_missing():
-    class TestConf(GoodConf):
-        a: str = Field()
-
-    c = TestConf()
+    c = RequiredConf()
 
     with pytest.raises(ValidationError):
         c.load()
 
     with pytest.raises(ValidationError):
-        TestConf(load=True)
+        RequiredConf(load=True)
 
 
 def test_set_on_init():
-    class TestConf(GoodConf):
-        a: str = Field()
-
     val = "test"
-    c = TestConf(a=val)
+    c = RequiredConf(a=val)
     assert c.a == val
 
 
-def test_env_prefix():
-    class TestConf(GoodConf):
-        a: bool = False
-
-        model_config = {"env_prefix": "PREFIX_"}
-
-    with env_var("PREFIX_A", "True"):
-        c = TestConf(load=True)
+def test_env_prefix(monkeypatch):
+    monkeypatch.setenv("PREFIX_A", "True")
+    c = EnvPrefixConf(load=True)
 
     assert c.a
 
 
-def test_precedence(tmpdir):
-    path = tmpdir.join("myapp.json")
-    path.write(json.dumps({"init": "file", "env": "file", "file": "file"}))
+def test_precedence(tmp_path, monkeypatch):
+    path = tmp_path / "myapp.json"
+    path.write_text(json.dumps({"init": "file", "env": "file", "file": "file"}))
 
     class TestConf(GoodConf, default_files=[path]):
         init: str = ""
         env: str = ""
         file: str = ""
 
-    os.environ["INIT"] = "env"
-    os.environ["ENV"] = "env"
-    try:
-        c = TestConf(init="init")
-        assert c.init == "init"
-        assert c.env == "env"
-        assert c.file == "file"
-    finally:
-        del os.environ["INIT"]
-        del os.environ["ENV"]
+    monkeypatch.setenv("INIT", "env")
+    monkeypatch.setenv("ENV", "env")
+    c = TestConf(init="init")
+    assert c.init == "init"
+    assert c.env == "env"
+    assert c.file == "file"
 
 
 def test_fileconfigsettingssource_repr():
@@ -1,13 +1,22 @@
-import os
-from contextlib import contextmanager
+from importlib.util import find_spec
+
+import pytest
 
 KEY = "GOODCONF_TEST"
 
 
-@contextmanager
-def env_var(key, value):
-    os.environ[key] = value
+def _has_module(name):
     try:
-        yield
-    finally:
-        del os.environ[key]
+        return find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+# Probe the optional dependencies once per session instead of per test.
+HAS_YAML = _has_module("ruamel.yaml")
+HAS_TOMLKIT = _has_module("tomlkit")
+
+requires_yaml = pytest.mark.skipif(not HAS_YAML, reason="[yaml] extra is not installed")
+requires_tomlkit = pytest.mark.skipif(
+    not HAS_TOMLKIT, reason="[toml] extra is not installed"
+)